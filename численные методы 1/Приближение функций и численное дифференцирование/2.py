@@ -3,30 +3,14 @@
 
 Использую разложение в степенной ряд для производной
 
-Вычисляю каждый член ряда по формуле: (k+1) * x^k / (2^k * (2k)!)
+Член ряда: (k+1) * x^k / (2^k * (2k)!), каждый следующий вычисляется через предыдущий (модуль series.py)
 
 Суммирую члены, пока абсолютное значение очередного члена не станет меньше заданной точности
 
 Возвращаю полученную сумму как значение производной
 """
 
-import math
-
-
-def compute_derivative(x: float, e: float) -> float:
-    sum_derivative = 0.0
-    k = 0
-    while True:
-        term = (k + 1) * (x ** k) / ((2 ** k) * math.factorial(2 * k))
-
-        sum_derivative += term
-
-        if abs(term) < e:
-            break
-
-        k += 1
-
-    return sum_derivative
+from series import compute_derivative
 
 
 x = 0.1
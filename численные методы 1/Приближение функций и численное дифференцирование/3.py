@@ -9,12 +9,18 @@
 
 Накапливаю сумму, пока отношение текущего члена к сумме превышает заданную точность
 
+Один раз строю чебышёвскую аппроксимацию ряда на [0.1, 0.5] (модуль chebyshev.py)
+
+Значения в точках таблицы считаю по коэффициентам, без повторного суммирования ряда
+
 Вывожу результаты в качестве таблицы значений функции f(x) в точках x = 0.1, 0.2, 0.3, 0.4, 0.5
 
 """
 
-def fun(x):
-    e = 0.0001
+from chebyshev import fit_chebyshev, clenshaw
+
+
+def fun(x, e=0.0001):
     k = 0
     a = x
     s = x
@@ -26,6 +32,10 @@ def fun(x):
     return s
 
 
+# Ряд суммируется только при построении аппроксимации, дальше - схема Кленшоу
+table = fit_chebyshev(lambda x: fun(x, 1e-16), 0.1, 0.5, tolerance=1e-10)
+print("Оценка погрешности аппроксимации:", table["error_bound"])
+
 for i in range(0, 5):
     x = 0.1 + i * 0.1
-    print("f(x) =", fun(x))
+    print("f(x) =", clenshaw(table, x))
@@ -20,32 +20,59 @@ a - список промежуточных точек [0.15, 0.25, 0.35, 0.45]
 p - значение по линейной интерполяции
 
 z - абсолютная погрешность интерполяции
+
+Точные значения в промежуточных точках - сумма того же ряда с точностью e = 1e-16
+
+Интерполяция выполняется по таблице узлов (модуль interpolation.py), для сравнения - кубическим сплайном
+
+Значения ряда в узлах вычисляются через кэш (модуль cache.py) один раз и сохраняются в f_values
 """
 
+import numpy as np
+
+from cache import SeriesCache
+from interpolation import Interpolator
+
 
-def fun(x):
-    e = 0.0001
+def fun(x, e=0.0001):
     a = x
     s = a
     k = 0
     while abs(a / s) > e:
         q = x / (8 * k ** 2 + 12 * k + 4)
         a *= q
-        s += q
+        s += a
         k += 1
     return s
 
 
+fun_cached = SeriesCache(fun, maxsize=64)
+
 a = []
 aj = []
+f_values = []
 for i in range(0, 5):
     x = round(0.1 + i * 0.1, 4)
-    print("f(x)", fun(x))
+    value = fun_cached(x)
+    print("f(x)", value)
     aj.append(x)
+    f_values.append(value)
     a.append(round(x + 0.1 / 2, 4))
+exact = np.vectorize(lambda x: fun(x, 1e-16))
+f_exact = exact(a[:4])
+
+linear = Interpolator(aj, f_values)
+p = linear(a[:4])
+z = linear.error(a[:4], exact)
+for i in range(0, 4):
+    print("x:", a[i], "f:", round(f_exact[i], 8), "p:", round(p[i], 7), "z:", round(z[i], 8))
+
+spline = Interpolator(aj, f_values, kind="spline")
+p = spline(a[:4])
+z = spline.error(a[:4], exact)
+print("Кубический сплайн:")
 for i in range(0, 4):
-    p = fun(aj[i]) + ((fun(aj[i + 1]) - fun(aj[i])) / (aj[i + 1] - aj[i])) * (a[i] - aj[i])
-    z = abs(fun(a[i]) - p)
-    print("x:", a[i], "f:", round(fun(a[i]), 8), "p:", round(p, 7), "z:", round(z, 8))
+    print("x:", a[i], "f:", round(f_exact[i], 8), "p:", round(p[i], 7), "z:", round(z[i], 8))
 print(a)
 print(aj)
+print("Кэш: попаданий", fun_cached.hits, "промахов", fun_cached.misses)
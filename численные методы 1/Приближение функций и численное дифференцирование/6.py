@@ -16,22 +16,13 @@
 Левая разность: f'(x) ≈ [f(x) - f(x-h)] / h
 
 Центральная разность: f'(x) ≈ [f(x+h) - f(x-h)] / (2h)
-"""
-
 
-import math
+Все три разности строятся по общему массиву значений f на равномерной сетке (модуль differentiation.py)
+"""
 
 
-def compute_f(x, epsilon=1e-6):
-    sum_f = 0.0
-    k = 0
-    while True:
-        term = (x ** (k + 1)) / ((2 ** k) * math.factorial(2 * k))
-        sum_f += term
-        if abs(term) < epsilon:
-            break
-        k += 1
-    return sum_f
+from differentiation import grid_differences, grid_values
+from series import compute_f_batch
 
 
 a = 1
@@ -39,16 +30,18 @@ h = 0.1
 i_values = [0.25 * i for i in range(1, 5)]  # i = 0.25, 0.5, 0.75, 1.0
 x_values = [a + i * h for i in i_values]
 
+# Сетка с шагом h/4 от x_1 - h до x_4 + h: f вычисляется один раз в каждом из 12 узлов
+step = 0.25 * h
+f_grid = grid_values(compute_f_batch, x_values[0] - h, step, 12)
+f_values = f_grid[4:8]
+right, left, central = grid_differences(f_grid, step, stride=4)
+
 print("Таблица разностных производных:")
 print("-" * 80)
 print(" x_i   |   f(x_i)   |   f_x (правая) |   f_y (левая) |   f_0 (центральная)")
 print("-" * 80)
 
-for x in x_values:
-    f_x = (compute_f(x + h) - compute_f(x)) / h  # Правая разность
-    f_y = (compute_f(x) - compute_f(x - h)) / h  # Левая разность
-    f_0 = (compute_f(x + h) - compute_f(x - h)) / (2 * h)  # Центральная разность
-
-    print(f" {x:.2f}  |  {compute_f(x):.6f}  |  {f_x:.6f}      |  {f_y:.6f}     |  {f_0:.6f}")
+for x, f, f_x, f_y, f_0 in zip(x_values, f_values, right, left, central):
+    print(f" {x:.2f}  |  {f:.6f}  |  {f_x:.6f}      |  {f_y:.6f}     |  {f_0:.6f}")
 
 print("-" * 80)
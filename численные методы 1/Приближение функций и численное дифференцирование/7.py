@@ -7,6 +7,10 @@
 
 Суммирование до точности epsilon = 1e-6
 
+f(x) и f'(x) вычисляются совместно за один проход по ряду, один раз в каждом узле равномерной сетки
+
+Разностные производные строятся по общему массиву значений f (модуль differentiation.py), дополнительно - экстраполяция Ричардсона
+
 Сравнение методов численного дифференцирования:
 
 Вычисляю три типа разностных производных в точках x = 1.1, 1.2, 1.3, 1.4
@@ -14,36 +18,22 @@
 Для каждого метода вычисляется погрешность относительно аналитической производной
 """
 
-import math
-
-
-def compute_f(x, epsilon=1e-6):
-    sum_f = 0.0
-    k = 0
-    while True:
-        term = (x ** (k + 1)) / ((2 ** k) * math.factorial(2 * k))
-        sum_f += term
-        if abs(term) < epsilon:
-            break
-        k += 1
-    return sum_f
+import numpy as np
 
-
-def compute_derivative(x, epsilon=1e-6):
-    sum_deriv = 0.0
-    k = 0
-    while True:
-        term = (k + 1) * (x ** k) / ((2 ** k) * math.factorial(2 * k))
-        sum_deriv += term
-        if abs(term) < epsilon:
-            break
-        k += 1
-    return sum_deriv
+from differentiation import grid_differences, richardson_derivative
+from series import compute_f_and_derivative_batch
 
 
 h = 0.1
 a = 1
-points = [a + i * h for i in range(1, 5)]  # Точки x_i = 0.2, 0.3, 0.4, 0.5
+# Узлы 0.9, 1.0, ..., 1.6: f и f' вычисляются один раз в каждом узле
+grid = a + h * np.arange(-1, 7)
+f_grid, f_prime_grid = compute_f_and_derivative_batch(grid)
+points = grid[2:6]  # Точки x_i = 1.1, 1.2, 1.3, 1.4
+f_primes = f_prime_grid[2:6]
+right, left, central = (d[1:5] for d in grid_differences(f_grid, h))
+richardson = richardson_derivative(f_grid, h)
+
 print("Погрешности разностных производных:")
 print("-" * 130)
 print(
@@ -51,13 +41,9 @@ print(
     "  Левая F_x |  Погрешность z(x) |  Центральная Fx0 |  Погрешность z(x)"
 )
 print("-" * 130)
-for x in points:
-    f_prime = compute_derivative(x)
-    F_right = (compute_f(x + h) - compute_f(x)) / h
+for x, f_prime, F_right, F_left, F_central in zip(points, f_primes, right, left, central):
     z_right = abs(f_prime - F_right)
-    F_left = (compute_f(x) - compute_f(x - h)) / h
     z_left = abs(f_prime - F_left)
-    F_central = (compute_f(x + h) - compute_f(x - h)) / (2 * h)
     z_central = abs(f_prime - F_central)
 
     print(
@@ -65,3 +51,8 @@ for x in points:
         f"{F_left:.6f}  |  {z_left:.6f}         |  {F_central:.6f}        |  {z_central:.6f}")
 
 print("-" * 130)
+
+print("\nЭкстраполяция Ричардсона (центральные разности с шагами h и 2h):")
+print("  x_i   |  f'(x_i)  |  Ричардсон  |  Погрешность z(x)")
+for x, f_prime, F_richardson in zip(points, f_primes, richardson):
+    print(f" {x:.1f}    |  {f_prime:.6f} |  {F_richardson:.6f}  |  {abs(f_prime - F_richardson):.2e}")
@@ -0,0 +1,55 @@
+"""
+Кэширование значений функций, заданных рядом:
+
+Оборачиваю любую функцию вида func(x) или func(x, epsilon)
+
+Ключ кэша - пара (x, epsilon), при повторном обращении значение берется из словаря без суммирования ряда
+
+Размер кэша ограничен maxsize, при переполнении удаляется значение, к которому дольше всего не обращались (LRU)
+
+Счетчики hits и misses показывают число попаданий и промахов
+
+Кэшируются только скалярные x: массивы NumPy и списки нехешируемы, для них вызов выбрасывает TypeError,
+пакетные функции ряда (compute_f_batch и др.) нужно вызывать напрямую
+"""
+
+from collections import OrderedDict
+
+
+class SeriesCache:
+    """LRU-кэш значений функции ряда по ключу (x, epsilon)"""
+
+    def __init__(self, func, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.func = func
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+
+    def __call__(self, x, epsilon=None):
+        key = (x, epsilon)
+        try:
+            hash(key)
+        except TypeError:
+            raise TypeError(f"SeriesCache принимает только скалярные x, получен {type(x).__name__}") from None
+        if key in self._values:
+            self._values.move_to_end(key)
+            self.hits += 1
+            return self._values[key]
+
+        self.misses += 1
+        value = self.func(x) if epsilon is None else self.func(x, epsilon)
+        self._values[key] = value
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+        return value
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
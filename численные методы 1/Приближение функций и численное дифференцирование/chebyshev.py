@@ -0,0 +1,126 @@
+"""
+Чебышёвская аппроксимация функции на отрезке [a, b]:
+
+Функция вычисляется один раз в узлах Чебышёва–Лобатто x_j = cos(πj/n), j = 0..n, отображенных на [a, b]
+
+Коэффициенты разложения f(x) ≈ Σ c_k T_k(t) находятся дискретным косинус-преобразованием
+
+Точность tolerance относительная: допустимая абсолютная погрешность tolerance * max(max|f|, 1)
+
+Число узлов удваивается, при этом значения в старых узлах используются повторно (узлы n входят в узлы 2n)
+
+Погрешность интерполяции по n узлам оценивается через коэффициенты по 2n узлам:
+сумма |c_k(n) - c_k(2n)| (наложение частот) плюс хвост |c_k(2n)| при k > n
+
+Лишние старшие коэффициенты отбрасываются, сумма их модулей добавляется к оценке погрешности
+
+Оценка сравнивается с фактической погрешностью в серединах между узлами и берется наибольшая
+
+Если при max_degree оценка остается больше допустимой, выбрасывается ValueError
+
+Вычисление:
+
+Каждое значение считается рекуррентной схемой Кленшоу с фиксированной стоимостью, для скаляров и массивов NumPy
+
+Таблица коэффициентов - обычный словарь, сохраняется в JSON и загружается в другом процессе без повторной подгонки
+"""
+
+import json
+
+import numpy as np
+
+
+def chebyshev_nodes(a, b, n):
+    """Узлы Чебышёва–Лобатто на [a, b]"""
+    t = np.cos(np.pi * np.arange(n + 1) / n)
+    return (a + b) / 2 + (b - a) / 2 * t
+
+
+def _coefficients(values):
+    n = len(values) - 1
+    j = np.arange(n + 1)
+    weights = np.ones(n + 1)
+    weights[0] = weights[n] = 0.5
+    c = (2.0 / n) * np.cos(np.pi * np.outer(j, j) / n) @ (weights * values)
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+
+def fit_chebyshev(func, a, b, tolerance=1e-10, max_degree=1024):
+    """Подгонка коэффициентов Чебышёва для func на [a, b] с оценкой погрешности не больше допустимой"""
+    if not a < b:
+        raise ValueError("Должно выполняться a < b")
+
+    n = 8
+    values = np.array([func(x) for x in chebyshev_nodes(a, b, n)], dtype=float)
+    while True:
+        # Узлы 2n: четные совпадают с узлами n, нечетные - середины между ними
+        middles = chebyshev_nodes(a, b, 2 * n)[1::2]
+        middle_values = np.array([func(x) for x in middles], dtype=float)
+        refined = np.empty(2 * n + 1)
+        refined[::2] = values
+        refined[1::2] = middle_values
+
+        c = _coefficients(values)
+        c_refined = _coefficients(refined)
+        allowed = tolerance * max(np.max(np.abs(refined)), 1.0)
+        aliasing = float(np.sum(np.abs(c - c_refined[:n + 1])) + np.sum(np.abs(c_refined[n + 1:])))
+        if aliasing <= allowed / 2:
+            break
+        if 2 * n > max_degree:
+            raise ValueError(f"Точность {tolerance} не достигнута при степени {max_degree}, "
+                             f"оценка погрешности {aliasing:.3g}")
+        n *= 2
+        values = refined
+
+    # Отбрасываю старшие коэффициенты, пока их суммарный вклад укладывается в оставшийся допуск
+    tail = np.cumsum(np.abs(c[::-1]))
+    drop = int(np.searchsorted(tail, allowed - aliasing, side="right"))
+    coefficients = c[:len(c) - drop] if drop < len(c) else c[:1]
+    truncation = float(np.sum(np.abs(c[len(coefficients):])))
+
+    table = {
+        "a": float(a),
+        "b": float(b),
+        "coefficients": coefficients.tolist(),
+        "error_bound": 0.0,
+    }
+
+    observed = float(np.max(np.abs(clenshaw(table, middles) - middle_values)))
+    table["error_bound"] = max(observed, aliasing + truncation)
+    if table["error_bound"] > allowed:
+        raise ValueError(f"Точность {tolerance} не достигнута, погрешность в серединах {observed:.3g}")
+    return table
+
+
+def clenshaw(table, x):
+    """Значение аппроксимации в точке x (скаляр или массив) по схеме Кленшоу"""
+    a = table["a"]
+    b = table["b"]
+    coefficients = table["coefficients"]
+
+    x = np.asarray(x, dtype=float)
+    t = (2 * x - a - b) / (b - a)
+    if np.any(np.abs(t) > 1 + 1e-12):
+        raise ValueError(f"Точки должны лежать на отрезке [{a}, {b}]")
+
+    b1 = np.zeros_like(t)
+    b2 = np.zeros_like(t)
+    for c in coefficients[:0:-1]:
+        b1, b2 = 2 * t * b1 - b2 + c, b1
+    result = t * b1 - b2 + coefficients[0]
+
+    if result.ndim == 0:
+        return float(result)
+    return result
+
+
+def save_chebyshev(table, path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(table, file)
+
+
+def load_chebyshev(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
@@ -0,0 +1,70 @@
+"""
+Численное дифференцирование на равномерной сетке:
+
+Функция вычисляется один раз в каждом узле сетки x_j = start + j * step
+
+Все разностные производные строятся из этого общего массива значений:
+значение f(x+h) для одного узла - это f(x) для соседнего
+
+Шаг разностной схемы h = stride * step, производные получаются во внутренних узлах сетки
+
+Правая разность: f'(x) ≈ [f(x+h) - f(x)] / h
+
+Левая разность: f'(x) ≈ [f(x) - f(x-h)] / h
+
+Центральная разность: f'(x) ≈ [f(x+h) - f(x-h)] / (2h)
+
+Экстраполяция Ричардсона:
+
+Центральные разности с шагами h, 2h, 4h, ... комбинируются, каждый уровень повышает порядок точности на 2
+
+При levels = 2 получается пятиточечная схема четвертого порядка
+"""
+
+import numpy as np
+
+
+def grid_values(func, start, step, count):
+    """Значения func (принимает массивы) в узлах равномерной сетки"""
+    return func(start + step * np.arange(count))
+
+
+def grid_differences(values, step, stride=1):
+    """Правая, левая и центральная разности во внутренних узлах сетки"""
+    values = np.asarray(values, dtype=float)
+    h = stride * step
+    n = len(values)
+    if n <= 2 * stride:
+        raise ValueError("Сетка слишком короткая для заданного шага")
+
+    inner = values[stride:n - stride]
+    forward = values[2 * stride:]
+    backward = values[:n - 2 * stride]
+
+    right = (forward - inner) / h
+    left = (inner - backward) / h
+    central = (forward - backward) / (2 * h)
+    return right, left, central
+
+
+def richardson_derivative(values, step, stride=1, levels=2):
+    """Производная экстраполяцией Ричардсона по центральным разностям, порядок точности 2 * levels"""
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    margin = stride * 2 ** (levels - 1)
+    if n <= 2 * margin:
+        raise ValueError("Сетка слишком короткая для заданного числа уровней")
+
+    # Центральные разности с шагами h, 2h, 4h, ... в узлах margin .. n - margin - 1
+    tableau = []
+    for level in range(levels):
+        s = stride * 2 ** level
+        h = s * step
+        forward = values[margin + s:n - margin + s]
+        backward = values[margin - s:n - margin - s]
+        tableau.append((forward - backward) / (2 * h))
+
+    for m in range(1, levels):
+        factor = 4 ** m
+        tableau = [(factor * tableau[j] - tableau[j + 1]) / (factor - 1) for j in range(len(tableau) - 1)]
+    return tableau[0]
@@ -0,0 +1,98 @@
+"""
+Кусочная интерполяция по таблице узлов (aj, f(aj)):
+
+Узлы сортируются один раз при построении, для каждого отрезка заранее вычисляются коэффициенты
+
+Отрезок для каждой точки запроса находится векторным двоичным поиском по узлам (np.searchsorted), O(log n) на точку
+
+Режимы:
+
+linear - линейная интерполяция между соседними узлами
+
+spline - естественный кубический сплайн, вторые производные в узлах находятся методом прогонки
+
+Оценка погрешности:
+
+error() сравнивает интерполяцию с точной функцией в точках запроса
+"""
+
+import numpy as np
+
+
+class Interpolator:
+    """Интерполяция по таблице узлов для массивов точек запроса"""
+
+    def __init__(self, nodes, values, kind="linear"):
+        nodes = np.asarray(nodes, dtype=float)
+        values = np.asarray(values, dtype=float)
+        if nodes.shape != values.shape or nodes.ndim != 1 or len(nodes) < 2:
+            raise ValueError("Нужны одномерные массивы узлов и значений одной длины, не меньше двух")
+        if kind not in ("linear", "spline"):
+            raise ValueError(f"Неизвестный режим интерполяции: {kind}")
+
+        order = np.argsort(nodes)
+        self.nodes = nodes[order]
+        self.values = values[order]
+        self.kind = kind
+
+        self.steps = np.diff(self.nodes)
+        if np.any(self.steps == 0):
+            raise ValueError("Узлы интерполяции должны быть различными")
+        self.slopes = np.diff(self.values) / self.steps
+        if kind == "spline":
+            self.moments = self._spline_moments()
+
+    def _spline_moments(self):
+        """Вторые производные естественного сплайна в узлах (прогонка)"""
+        n = len(self.nodes) - 1
+        h = self.steps
+        m = np.zeros(n + 1)
+        if n < 2:
+            return m
+
+        alpha = np.zeros(n)
+        beta = np.zeros(n)
+        for i in range(1, n):
+            A = h[i - 1]
+            B = h[i]
+            C = 2 * (h[i - 1] + h[i])
+            F = 6 * (self.slopes[i] - self.slopes[i - 1])
+            denominator = C - A * alpha[i - 1]
+            alpha[i] = B / denominator
+            beta[i] = (F - A * beta[i - 1]) / denominator
+
+        for i in range(n - 1, 0, -1):
+            m[i] = beta[i] - alpha[i] * m[i + 1]
+        return m
+
+    def locate(self, x):
+        """Номера отрезков [x_i, x_(i+1)], содержащих точки x"""
+        x = np.asarray(x, dtype=float)
+        if np.any(x < self.nodes[0]) or np.any(x > self.nodes[-1]):
+            raise ValueError(f"Точки должны лежать на отрезке [{self.nodes[0]}, {self.nodes[-1]}]")
+        i = np.searchsorted(self.nodes, x, side="right") - 1
+        return np.clip(i, 0, len(self.nodes) - 2)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        i = self.locate(x)
+        left = x - self.nodes[i]
+
+        if self.kind == "linear":
+            result = self.values[i] + self.slopes[i] * left
+        else:
+            h = self.steps[i]
+            right = self.nodes[i + 1] - x
+            m0 = self.moments[i]
+            m1 = self.moments[i + 1]
+            result = ((m0 * right ** 3 + m1 * left ** 3) / (6 * h) +
+                      (self.values[i] / h - m0 * h / 6) * right +
+                      (self.values[i + 1] / h - m1 * h / 6) * left)
+
+        if result.ndim == 0:
+            return float(result)
+        return result
+
+    def error(self, x, func):
+        """Абсолютная погрешность интерполяции относительно точной функции func (принимает массивы)"""
+        return np.abs(func(np.asarray(x, dtype=float)) - self(x))
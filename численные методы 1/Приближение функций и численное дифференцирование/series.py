@@ -0,0 +1,154 @@
+"""
+Общий модуль суммирования ряда для скриптов 2.py, 6.py и 7.py:
+
+Функция: f(x) = Σ x^(k+1) / (2^k * (2k)!)
+
+Производная: f'(x) = Σ (k+1) * x^k / (2^k * (2k)!)
+
+Суммирование до тех пор, пока модуль очередного члена не станет меньше epsilon
+
+Каждый следующий член ряда вычисляю через предыдущий, как в 1.py и 3.py
+
+Коэффициент связи: q = x / (8k² + 12k + 4), для производной тем же q пересчитывается x^k / (2^k * (2k)!)
+
+Факториалы и степени x не вычисляются, поэтому стоимость одного члена O(1) и большие x не приводят к переполнению знаменателя
+
+Если член ряда все же становится бесконечным или NaN (|x| порядка 1e6 и больше, x = nan), скалярные функции
+выбрасывают OverflowError
+
+Пакетный режим:
+
+На вход подается массив NumPy значений x, члены ряда для всех элементов вычисляются одновременно
+тем же потоком series_terms, что и в скалярном случае
+
+Элемент исключается из потока (маской, переданной через send), как только его собственный член ряда становится меньше epsilon
+
+Результат совпадает с поэлементным вызовом скалярной функции
+
+Элемент с бесконечным или NaN членом ряда тоже исключается, в результате для него остается inf или nan
+
+Совместное вычисление f и f':
+
+Оба ряда имеют общие знаменатели 2^k * (2k)!, поэтому f(x) и f'(x) суммируются за один проход по k
+
+Каждая сумма перестает накапливаться, как только ее член становится меньше epsilon
+
+В пакетном режиме f и f' - два потока series_terms, которые продвигаются по k в одном цикле
+"""
+
+import math
+
+import numpy as np
+
+
+def term_ratio(x, k):
+    """Коэффициент связи q = a_(k+1) / a_k для членов ряда f"""
+    return x / (8 * k ** 2 + 12 * k + 4)
+
+
+def series_terms(x, derivative=False):
+    """Бесконечный поток пар (член ряда, частичная сумма) для f или f', x - число или массив NumPy"""
+    # a = x^(k+1) / (2^k * (2k)!) для f и x^k / (2^k * (2k)!) для f'
+    if derivative:
+        a = np.ones_like(x) if isinstance(x, np.ndarray) else 1.0
+    else:
+        a = x
+    s = 0.0
+    k = 0
+    while True:
+        term = (k + 1) * a if derivative else a
+        s += term
+        keep = yield term, s
+        # Для массива send(mask) оставляет в потоке только отмеченные элементы
+        if keep is not None:
+            x = x[keep]
+            a = a[keep]
+            s = s[keep]
+        a = a * term_ratio(x, k)
+        k += 1
+
+
+def _check_term(term, x):
+    if not math.isfinite(term):
+        raise OverflowError(f"Член ряда стал бесконечным при x = {x}")
+
+
+def compute_f(x, epsilon=1e-6):
+    for term, sum_f in series_terms(x):
+        _check_term(term, x)
+        if abs(term) < epsilon:
+            return sum_f
+
+
+def compute_derivative(x, epsilon=1e-6):
+    for term, sum_deriv in series_terms(x, derivative=True):
+        _check_term(term, x)
+        if abs(term) < epsilon:
+            return sum_deriv
+
+
+def _batch_sums(x, epsilon, *derivatives):
+    """Суммы рядов для массива x, по одному потоку series_terms на каждый флаг derivative
+
+    Потоки продвигаются по k в одном цикле, элемент выходит из потока на своем первом члене меньше epsilon"""
+    x = np.asarray(x, dtype=float)
+    results = []
+    streams = []
+    for derivative in derivatives:
+        terms = series_terms(x.ravel(), derivative)
+        sums = np.zeros(x.size)
+        results.append(sums)
+        streams.append((terms, np.arange(x.size), sums, next(terms)))
+
+    while streams:
+        running = []
+        for terms, index, sums, (term, partial) in streams:
+            done = (np.abs(term) < epsilon) | ~np.isfinite(term)
+            sums[index[done]] = partial[done]
+            keep = ~done
+            index = index[keep]
+            if index.size:
+                running.append((terms, index, sums, terms.send(keep)))
+        streams = running
+    return tuple(sums.reshape(x.shape) for sums in results)
+
+
+def compute_f_batch(x, epsilon=1e-6):
+    """Значения f для массива x за один общий проход по k"""
+    return _batch_sums(x, epsilon, False)[0]
+
+
+def compute_derivative_batch(x, epsilon=1e-6):
+    """Значения f' для массива x за один общий проход по k"""
+    return _batch_sums(x, epsilon, True)[0]
+
+
+def compute_f_and_derivative(x, epsilon=1e-6):
+    """Пара (f(x), f'(x)) за один проход по общим членам ряда"""
+    a = x  # x^(k+1) / (2^k * (2k)!)
+    c = 1.0  # x^k / (2^k * (2k)!)
+    sum_f = 0.0
+    sum_deriv = 0.0
+    f_done = False
+    deriv_done = False
+    k = 0
+    while not (f_done and deriv_done):
+        if not f_done:
+            _check_term(a, x)
+            sum_f += a
+            f_done = abs(a) < epsilon
+        if not deriv_done:
+            term = (k + 1) * c
+            _check_term(term, x)
+            sum_deriv += term
+            deriv_done = abs(term) < epsilon
+        q = term_ratio(x, k)
+        a *= q
+        c *= q
+        k += 1
+    return sum_f, sum_deriv
+
+
+def compute_f_and_derivative_batch(x, epsilon=1e-6):
+    """Массивы f и f' для массива x за один общий проход по k"""
+    return _batch_sums(x, epsilon, False, True)
@@ -0,0 +1,201 @@
+"""
+Потоковое табулирование функции на большой сетке:
+
+Отрезок [a, b] разбивается на count равноотстоящих узлов, узлы обходятся генератором порциями по chunk_size
+
+Каждая порция вычисляется пакетной функцией ряда (например, compute_f_batch из series.py)
+
+Результат сразу записывается в файл, поэтому расход памяти не зависит от длины таблицы:
+
+npy - массив значений в отображенном в память файле формата .npy (читается через np.load(..., mmap_mode="r"))
+
+csv - дописываемый текстовый файл со строками "x,f(x)"
+
+Возобновление:
+
+После каждой порции рядом с таблицей сохраняется файл состояния <path>.progress с номером первого невычисленного узла
+
+При повторном запуске с теми же параметрами вычисление продолжается с последней завершенной порции
+
+Ход вычисления и производительность (узлов в секунду) передаются в функцию progress
+
+Параллельное табулирование:
+
+Порции узлов распределяются между процессами пула (число процессов и размер порции задаются)
+
+Процессу передаются только номера узлов порции, значения x он вычисляет сам
+
+Результат собирается по порядку в массив NumPy или записывается процессами прямо в общую память (shared memory)
+
+Блок общей памяти после использования нужно закрыть и освободить: block.close(), block.unlink()
+
+Функция должна быть определена на уровне модуля, чтобы ее можно было передать в другой процесс
+"""
+
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from series import compute_f_batch
+
+
+def iter_chunks(a, b, count, chunk_size):
+    """Генератор порций сетки: (номер первого узла порции, массив x)"""
+    step = (b - a) / (count - 1)
+    for start in range(0, count, chunk_size):
+        stop = min(start + chunk_size, count)
+        yield start, a + step * np.arange(start, stop)
+
+
+def print_progress(done, count, elapsed):
+    throughput = done / elapsed if elapsed > 0 else float("inf")
+    print(f"Вычислено {done}/{count} ({100 * done / count:.1f}%), {throughput:.0f} узлов/с")
+
+
+def _load_state(state_path, params):
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, encoding="utf-8") as file:
+        state = json.load(file)
+    return state if state["params"] == params else None
+
+
+def _save_state(state_path, params, done, size):
+    tmp_path = state_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump({"params": params, "done": done, "size": size}, file)
+    os.replace(tmp_path, state_path)
+
+
+def tabulate_to_file(func, a, b, count, path, chunk_size=1_000_000, fmt="npy", progress=None):
+    """Табулирование func на [a, b] в файл порциями с возможностью возобновления"""
+    if fmt not in ("npy", "csv"):
+        raise ValueError(f"Неизвестный формат таблицы: {fmt}")
+    if count < 2 or chunk_size < 1:
+        raise ValueError("Нужно не меньше двух узлов и положительный размер порции")
+
+    params = {"a": a, "b": b, "count": count, "chunk_size": chunk_size, "fmt": fmt}
+    state_path = path + ".progress"
+    state = _load_state(state_path, params) if os.path.exists(path) else None
+    done = state["done"] if state else 0
+
+    if fmt == "npy":
+        mode = "r+" if state else "w+"
+        table = np.lib.format.open_memmap(path, mode=mode, dtype=np.float64, shape=(count,))
+    else:
+        table = open(path, "r+b" if state else "wb")
+        # Отбрасываю строки незавершенной порции
+        table.truncate(state["size"] if state else 0)
+        table.seek(0, os.SEEK_END)
+
+    started = time.perf_counter()
+    computed = 0
+    try:
+        for start, x in iter_chunks(a, b, count, chunk_size):
+            if start < done:
+                continue
+            values = func(x)
+
+            if fmt == "npy":
+                table[start:start + len(x)] = values
+                table.flush()
+                size = 0
+            else:
+                np.savetxt(table, np.column_stack((x, values)), delimiter=",", fmt="%.17g")
+                table.flush()
+                size = table.tell()
+
+            done = start + len(x)
+            computed += len(x)
+            _save_state(state_path, params, done, size)
+            if progress is not None:
+                progress(done, count, time.perf_counter() - started)
+    finally:
+        if fmt == "npy":
+            del table
+        else:
+            table.close()
+
+    os.remove(state_path)
+    elapsed = time.perf_counter() - started
+    return {
+        "points": computed,
+        "seconds": elapsed,
+        "throughput": computed / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def _evaluate_chunk(func, a, step, start, stop):
+    return func(a + step * np.arange(start, stop))
+
+
+def _fill_shared_chunk(func, name, count, a, step, start, stop):
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        table = np.ndarray((count,), dtype=np.float64, buffer=block.buf)
+        table[start:stop] = _evaluate_chunk(func, a, step, start, stop)
+        del table
+    finally:
+        block.close()
+
+
+def _chunk_bounds(count, chunk_size):
+    starts = list(range(0, count, chunk_size))
+    stops = [min(start + chunk_size, count) for start in starts]
+    return starts, stops
+
+
+def parallel_tabulate(func, a, b, count, workers=None, chunk_size=100_000):
+    """Табулирование func на [a, b] в пуле процессов, результат - массив NumPy в порядке узлов"""
+    if count < 2 or chunk_size < 1:
+        raise ValueError("Нужно не меньше двух узлов и положительный размер порции")
+    step = (b - a) / (count - 1)
+    starts, stops = _chunk_bounds(count, chunk_size)
+    n = len(starts)
+
+    table = np.empty(count)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(_evaluate_chunk, [func] * n, [a] * n, [step] * n, starts, stops)
+        for start, stop, values in zip(starts, stops, chunks):
+            table[start:stop] = values
+    return table
+
+
+def parallel_tabulate_shared(func, a, b, count, workers=None, chunk_size=100_000):
+    """Табулирование в пуле процессов с записью в общую память, результат - пара (массив, блок памяти)"""
+    if count < 2 or chunk_size < 1:
+        raise ValueError("Нужно не меньше двух узлов и положительный размер порции")
+    step = (b - a) / (count - 1)
+    starts, stops = _chunk_bounds(count, chunk_size)
+    n = len(starts)
+
+    block = shared_memory.SharedMemory(create=True, size=count * np.dtype(np.float64).itemsize)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_fill_shared_chunk, [func] * n, [block.name] * n, [count] * n,
+                              [a] * n, [step] * n, starts, stops))
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    return np.ndarray((count,), dtype=np.float64, buffer=block.buf), block
+
+
+if __name__ == "__main__":
+    path = os.path.join(tempfile.gettempdir(), "f_table.npy")
+    stats = tabulate_to_file(compute_f_batch, 0.1, 0.5, 10 ** 7, path, progress=print_progress)
+    print(f"Таблица: {path}")
+    print(f"Узлов: {stats['points']}, время: {stats['seconds']:.2f} с, {stats['throughput']:.0f} узлов/с")
+
+    table = np.load(path, mmap_mode="r")
+    print("f(0.1) =", table[0], "f(0.5) =", table[-1])
+
+    started = time.perf_counter()
+    table = parallel_tabulate(compute_f_batch, 0.1, 0.5, 10 ** 7)
+    elapsed = time.perf_counter() - started
+    print(f"Параллельно ({os.cpu_count()} процессов): {elapsed:.2f} с, {10 ** 7 / elapsed:.0f} узлов/с")
@@ -7,6 +7,12 @@
 
 Условие остановки по относительной погрешности
 
+Ускорение сходимости (accelerate=True):
+
+Метод Стеффенсена: по x, g(x), g(g(x)) строится экстраполяция Эйткена x - (g(x) - x)² / (g(g(x)) - 2g(x) + x)
+
+Каждая итерация стоит два вычисления g, зато сходимость квадратичная
+
 Метод Ньютона:
 
 Использование производной для ускорения сходимости
@@ -22,36 +28,130 @@
 Последовательное сужение интервала в 2 раза
 
 Гарантированная сходимость
+
+Гибридный метод:
+
+Хранит интервал [a,b] со значениями f на концах, как метод деления пополам
+
+Делает шаг Ньютона, а если он выходит за интервал - шаг обратной квадратичной интерполяции или секущих
+
+Если шаг все равно вне интервала или длиннее половины позапрошлого шага - деление пополам
+
+Сходимость гарантирована, а число итераций близко к методу Ньютона
+
+Трассировка итераций:
+
+Методы ничего не печатают сами, каждое приближение передается в необязательный объект tracer(k, x)
+
+PrintTracer выводит итерации на консоль, HistoryTracer записывает приближения в заранее выделенный массив
+
+Без трассировщика на итерацию приходится лишь одна проверка tracer is not None
+
+Поиск всех корней на отрезке:
+
+f вычисляется сразу на всей сетке, сетка сгущается там, где sin(1/x) колеблется быстро (у нуля)
+
+Каждая смена знака между соседними узлами дает интервал с корнем
+
+Все интервалы уточняются одновременно векторным делением пополам
+
+Векторный метод Ньютона:
+
+Решаю семейство уравнений x - c + sin(1/x) = 0 сразу для массива параметров c и начальных приближений
+
+Все задачи итерируются вместе средствами NumPy, сошедшиеся элементы замораживаются маской
+
+Для каждого элемента возвращаются корень, число итераций и состояние: сошелся, исчерпан лимит итераций,
+нулевая производная или расходимость - ошибки не прерывают вычисление остальных элементов
 """
 
 import math
 
+import numpy as np
+
 
 def f(x):
     return x - 2 + math.sin(1 / x)
 
 
-def simple_iteration_method(x0, epsilon):
+class PrintTracer:
+    """Вывод каждой итерации на консоль"""
+
+    def __call__(self, k, x):
+        print(f"Итерация {k}: x = {x:.6f}, невязка = {abs(f(x)):.6f}")
+
+
+class HistoryTracer:
+    """Запись приближений в заранее выделенный массив"""
+
+    def __init__(self, capacity=128):
+        self.history = np.empty(capacity)
+        self.count = 0
+
+    def __call__(self, k, x):
+        if self.count == len(self.history):
+            self.history = np.concatenate((self.history, np.empty(len(self.history))))
+        self.history[self.count] = x
+        self.count += 1
+
+    @property
+    def values(self):
+        return self.history[:self.count]
+
+
+def g(x):
+    return 2 - math.sin(1 / x)
+
+
+def simple_iteration_method(x0, epsilon, tracer=None, accelerate=False):
+    if accelerate:
+        return steffensen_method(x0, epsilon, tracer)
+
     k = 0
     x_prev = x0
 
     while True:
-        x_next = 2 - math.sin(1 / x_prev)
+        x_next = g(x_prev)
         k += 1
 
         if abs((x_next - x_prev) / x_next) < epsilon:
             break
 
-        print(f"Итерация {k}: x = {x_next:.6f}, невязка = {abs(f(x_next)):.6f}")
+        if tracer is not None:
+            tracer(k, x_next)
         x_prev = x_next
 
     return x_next, k
 
 
-def newton_method(x0, epsilon):
-    def df(x):
-        return 1 - math.cos(1 / x) / (x ** 2)
+def steffensen_method(x0, epsilon, tracer=None, max_iter=100):
+    k = 0
+    x_prev = x0
 
+    while k < max_iter:
+        x1 = g(x_prev)
+        x2 = g(x1)
+        k += 1
+
+        # Экстраполяция Эйткена по трем последовательным приближениям
+        denominator = x2 - 2 * x1 + x_prev
+        x_next = x_prev - (x1 - x_prev) ** 2 / denominator if denominator != 0 else x2
+
+        if abs((x_next - x_prev) / x_next) < epsilon:
+            break
+
+        if tracer is not None:
+            tracer(k, x_next)
+        x_prev = x_next
+
+    return x_next, k
+
+
+def df(x):
+    return 1 - math.cos(1 / x) / (x ** 2)
+
+
+def newton_method(x0, epsilon, tracer=None):
     k = 0
     x_prev = x0
     x_next = x_prev - f(x_prev) / df(x_prev)
@@ -60,13 +160,15 @@ def newton_method(x0, epsilon):
         k += 1
         x_prev = x_next
         x_next = x_prev - f(x_prev) / df(x_prev)
-        print(f"Итерация {k}: x = {x_next:.6f}, невязка = {abs(f(x_next)):.6f}")
+        if tracer is not None:
+            tracer(k, x_next)
 
     return x_next, k
 
 
-def bisection_method(a, b, epsilon, max_iter=100):
-    if f(a) * f(b) >= 0:
+def bisection_method(a, b, epsilon, max_iter=100, tracer=None):
+    fa = f(a)
+    if fa * f(b) >= 0:
         raise ValueError("Функция должна иметь разные знаки на концах интервала")
 
     k = 0
@@ -76,38 +178,209 @@ def bisection_method(a, b, epsilon, max_iter=100):
     while abs((x_next - x_prev) / x_next) > epsilon and k < max_iter:
         k += 1
         x_prev = x_next
+        f_next = f(x_next)
 
-        if f(a) * f(x_next) < 0:
+        if fa * f_next < 0:
             b = x_next
         else:
             a = x_next
+            fa = f_next
 
         x_next = (a + b) / 2
-        print(f"Итерация {k}: x = {x_next:.6f}, невязка = {abs(f(x_next)):.6f}")
+        if tracer is not None:
+            tracer(k, x_next)
 
     return x_next, k
 
 
+def hybrid_method(a, b, epsilon, max_iter=100, tracer=None):
+    fa = f(a)
+    fb = f(b)
+    if fa * fb >= 0:
+        raise ValueError("Функция должна иметь разные знаки на концах интервала")
+    if a > b:
+        a, b, fa, fb = b, a, fb, fa
+
+    # Последние приближения (x, f(x)), первым идет конец интервала с меньшей невязкой
+    history = [(a, fa), (b, fb)] if abs(fa) < abs(fb) else [(b, fb), (a, fa)]
+    step_old = b - a
+    step = b - a
+    k = 0
+
+    while k < max_iter:
+        k += 1
+        x, fx = history[0]
+        x1, fx1 = history[1]
+
+        # Шаг Ньютона
+        d = df(x)
+        candidate = x - fx / d if d != 0 else None
+
+        # Обратная квадратичная интерполяция или метод секущих
+        if candidate is None or not a < candidate < b:
+            candidate = None
+            if len(history) == 3 and len({fx, fx1, history[2][1]}) == 3:
+                x2, fx2 = history[2]
+                candidate = (x * fx1 * fx2 / ((fx - fx1) * (fx - fx2)) +
+                             x1 * fx * fx2 / ((fx1 - fx) * (fx1 - fx2)) +
+                             x2 * fx * fx1 / ((fx2 - fx) * (fx2 - fx1)))
+            elif fx != fx1:
+                candidate = x - fx * (x - x1) / (fx - fx1)
+
+        # Деление пополам, если шаг вне интервала или не меньше половины позапрошлого шага
+        if candidate is None or not a < candidate < b or abs(candidate - x) > step_old / 2:
+            candidate = (a + b) / 2
+        step_old = step
+        step = abs(candidate - x)
+
+        f_candidate = f(candidate)
+        if fa * f_candidate < 0:
+            b, fb = candidate, f_candidate
+        else:
+            a, fa = candidate, f_candidate
+        history = [(candidate, f_candidate)] + history[:2]
+
+        if tracer is not None:
+            tracer(k, candidate)
+        if f_candidate == 0 or step / abs(candidate) < epsilon or (b - a) / abs(candidate) < epsilon:
+            break
+
+    return history[0][0], k
+
+
+NEWTON_CONVERGED = 0
+NEWTON_MAX_ITER = 1
+NEWTON_ZERO_DERIVATIVE = 2
+NEWTON_DIVERGED = 3
+
+
+def newton_method_batch(x0, c, epsilon, max_iter=100, limit=1e10):
+    """Метод Ньютона для x - c + sin(1/x) = 0 по массивам начальных приближений x0 и параметров c"""
+    x0, c = np.broadcast_arrays(np.asarray(x0, dtype=float), np.asarray(c, dtype=float))
+    x = x0.copy()
+    c = c.copy()
+    k = np.zeros(x.shape, dtype=int)
+    status = np.full(x.shape, NEWTON_MAX_ITER)
+    active = np.ones(x.shape, dtype=bool)
+
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter):
+            index = np.flatnonzero(active)
+            if index.size == 0:
+                break
+            x_prev = x.flat[index]
+            df = 1 - np.cos(1 / x_prev) / x_prev ** 2
+            x_next = x_prev - (x_prev - c.flat[index] + np.sin(1 / x_prev)) / df
+
+            zero = (df == 0) | ~np.isfinite(df)
+            diverged = ~zero & (~np.isfinite(x_next) | (x_next == 0) | (np.abs(x_next) > limit))
+            ok = ~(zero | diverged)
+            done = ok & (np.abs((x_next - x_prev) / x_next) < epsilon)
+
+            x.flat[index[ok]] = x_next[ok]
+            k.flat[index[ok]] += 1
+            status.flat[index[zero]] = NEWTON_ZERO_DERIVATIVE
+            status.flat[index[diverged]] = NEWTON_DIVERGED
+            status.flat[index[done]] = NEWTON_CONVERGED
+            active.flat[index[~ok | done]] = False
+
+    return x, k, status
+
+
+def f_batch(x, c=2.0):
+    return x - c + np.sin(1 / x)
+
+
+def find_all_roots(a, b, c=2.0, n=1000, epsilon=1e-10, max_points=10 ** 7, max_iter=200):
+    """Все корни x - c + sin(1/x) = 0 на отрезке [a, b], не содержащем 0"""
+    if not a < b or a <= 0 <= b:
+        raise ValueError("Нужен отрезок a < b, не содержащий точку 0")
+
+    # Сгущаю сетку там, где sin(1/x) колеблется быстро: не меньше 16 узлов на период
+    x = np.linspace(a, b, n)
+    pieces = np.maximum(1, np.ceil(np.abs(np.diff(1 / x)) / (np.pi / 8))).astype(int)
+    total = int(pieces.sum())
+    if total + 1 > max_points:
+        raise ValueError(f"Для отрезка нужно {total + 1} узлов сетки, больше max_points = {max_points}")
+    first = np.repeat(np.cumsum(pieces) - pieces, pieces)
+    share = (np.arange(total) - first) / np.repeat(pieces, pieces)
+    grid = np.append(np.repeat(x[:-1], pieces) + share * np.repeat(np.diff(x), pieces), b)
+
+    values = f_batch(grid, c)
+    exact = grid[values == 0]
+    change = np.flatnonzero(values[:-1] * values[1:] < 0)
+
+    # Деление пополам сразу для всех найденных интервалов
+    lo = grid[change]
+    hi = grid[change + 1]
+    f_lo = values[change]
+    for _ in range(max_iter):
+        mid = (lo + hi) / 2
+        if np.all(hi - lo <= epsilon * np.maximum(1, np.abs(mid))):
+            break
+        f_mid = f_batch(mid, c)
+        left = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(left, mid, lo)
+        f_lo = np.where(left, f_mid, f_lo)
+        hi = np.where(left, hi, mid)
+
+    return np.sort(np.concatenate((exact, (lo + hi) / 2)))
+
+
 if __name__ == "__main__":
     epsilon = 0.0001
 
     print("А) Метод простой итерации:")
     print("=" * 50)
-    root1, iter1 = simple_iteration_method(1.2, epsilon)
+    root1, iter1 = simple_iteration_method(1.2, epsilon, tracer=PrintTracer())
     print(f"Результат: x = {root1:.6f}, итераций: {iter1}")
     print(f"Невязка: {abs(f(root1)):.6f}\n")
 
+    print("А*) Метод простой итерации с ускорением Стеффенсена:")
+    print("=" * 50)
+    root1s, iter1s = simple_iteration_method(1.2, epsilon, tracer=PrintTracer(), accelerate=True)
+    print(f"Результат: x = {root1s:.6f}, итераций: {iter1s}")
+    print(f"Невязка: {abs(f(root1s)):.6f}")
+    print(f"Вычислений g: {2 * iter1s} вместо {iter1} без ускорения\n")
+
     print("Б) Метод Ньютона:")
     print("=" * 50)
-    root2, iter2 = newton_method(1.0, epsilon)
+    root2, iter2 = newton_method(1.0, epsilon, tracer=PrintTracer())
     print(f"Результат: x = {root2:.6f}, итераций: {iter2}")
     print(f"Невязка: {abs(f(root2)):.6f}\n")
 
     print("В) Метод деления отрезка пополам:")
     print("=" * 50)
     try:
-        root3, iter3 = bisection_method(1.0, 2.0, epsilon)
+        root3, iter3 = bisection_method(1.0, 2.0, epsilon, tracer=PrintTracer())
         print(f"Результат: x = {root3:.6f}, итераций: {iter3}")
         print(f"Невязка: {abs(f(root3)):.6f}")
     except ValueError as e:
-        print(f"Ошибка: {e}")
\ No newline at end of file
+        print(f"Ошибка: {e}")
+
+    print("\nГ) Гибридный метод (Ньютон, интерполяция, деление пополам):")
+    print("=" * 50)
+    root4, iter4 = hybrid_method(1.0, 2.0, epsilon, tracer=PrintTracer())
+    print(f"Результат: x = {root4:.6f}, итераций: {iter4}")
+    print(f"Невязка: {abs(f(root4)):.6f}")
+
+    print("\nД) Векторный метод Ньютона для x - c + sin(1/x) = 0:")
+    print("=" * 50)
+    c_values = np.linspace(1.5, 3.0, 7)
+    states = {
+        NEWTON_CONVERGED: "сошелся",
+        NEWTON_MAX_ITER: "лимит итераций",
+        NEWTON_ZERO_DERIVATIVE: "нулевая производная",
+        NEWTON_DIVERGED: "расходится",
+    }
+    roots, iters, status = newton_method_batch(c_values, c_values, epsilon)
+    for c, root, k, state in zip(c_values, roots, iters, status):
+        print(f"c = {c:.2f}: x = {root:.6f}, итераций: {k}, состояние: {states[state]}, "
+              f"невязка = {abs(root - c + math.sin(1 / root)):.6f}")
+
+    print("\nЕ) Поиск всех корней x - c + sin(1/x) = 0 на отрезке:")
+    print("=" * 50)
+    for c, a, b in [(2.0, 0.01, 5.0), (0.5, 0.01, 1.0)]:
+        roots = find_all_roots(a, b, c)
+        print(f"c = {c}, [{a}, {b}]: найдено корней: {len(roots)}")
+        print("  ", ", ".join(f"{root:.6f}" for root in roots[-8:]))
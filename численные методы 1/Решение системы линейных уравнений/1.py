@@ -5,12 +5,36 @@
 
 Обратный ход: последовательное нахождение неизвестных
 
+LU-разложение:
+
+Метод Гаусса с частичным выбором ведущего элемента, строки подматрицы обновляются одной векторной операцией ранга 1
+
+Множители сохраняются, поэтому разложение строится один раз, а solve() решает систему для любого числа правых частей
+
+Пакетный метод Гаусса:
+
+Стопка независимых систем (batch, n, n) решается одновременно, выбор ведущего элемента и исключение идут сразу по всем системам
+
+Вырожденные системы отмечаются флагом и получают решение NaN, остальные решаются как обычно
+
+Разреженные матрицы:
+
+Итерационные методы принимают как плотную матрицу NumPy, так и разреженную матрицу CSRMatrix
+
+CSR хранит только ненулевые элементы: массивы значений, номеров столбцов и начал строк
+
+Для CSR одна итерация стоит O(nnz) - пропорционально числу ненулевых элементов, а не n²
+
 Метод простой итерации:
 
 Последовательное уточнение решения по формуле: x_i^(k+1) = (b_i - ΣA_ij*x_j^k)/A_ii
 
 Использую значения с предыдущей итерации
 
+Все компоненты обновляются сразу: x^(k+1) = x^k - (A x^k - b)/diag(A), невязка считается один раз за итерацию
+
+Приближения хранятся в двух заранее выделенных массивах, которые меняются ролями
+
 Метод Зейделя:
 
 Модификация метода простой итерации
@@ -19,6 +43,22 @@
 
 Более быстрая сходимость
 
+Многоцветное упорядочивание (ordering="multicolor"):
+
+Неизвестные раскрашиваются по графу ненулевых элементов A так, что неизвестные одного цвета не связаны между собой
+
+Методы Зейделя и релаксации обходят цвета по очереди и обновляют все неизвестные цвета одной векторной операцией
+
+Для пятиточечного шаблона получается красно-черное упорядочивание из двух цветов
+
+Метод сопряженных градиентов:
+
+Для симметричных положительно определенных матриц, число итераций растет как корень из числа обусловленности
+
+Предобуславливатели: Якоби (деление на диагональ) и SSOR (симметричная верхняя релаксация с параметром ω)
+
+Матрица может быть плотной, разреженной CSRMatrix или функцией умножения на вектор
+
 Метод релаксации:
 
 Введение параметра релаксации ω
@@ -26,81 +66,301 @@
 При ω=1 эквивалентен методу Зейделя
 
 Оптимальный ω ускоряет сходимость
+
+Подбор ω:
+
+Кандидаты ω решаются параллельно в пуле процессов, возвращается решение с наименьшим числом итераций без повторного счета
+
+Адаптивный режим оценивает спектральный радиус ρ метода Якоби по отношению D-норм соседних шагов
+(с экстраполяцией Эйткена, пока оценка не установится) и берет ω = 2 / (1 + √(1 - ρ²))
+
+Релаксация продолжается с последнего приближения Якоби, число итераций включает итерации оценки
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
 
+class LUDecomposition:
+    """LU-разложение с частичным выбором ведущего элемента: PA = LU"""
+
+    def __init__(self, A):
+        A = np.array(A, dtype=float)
+        n = len(A)
+        if A.shape != (n, n):
+            raise ValueError("Матрица должна быть квадратной")
+
+        perm = np.arange(n)
+        for i in range(n):
+            p = i + np.argmax(np.abs(A[i:, i]))
+            if A[p, i] == 0:
+                raise ValueError("Матрица вырождена")
+            if p != i:
+                A[[i, p]] = A[[p, i]]
+                perm[[i, p]] = perm[[p, i]]
+
+            # Множители под ведущим элементом и обновление оставшейся подматрицы ранга 1
+            A[i + 1:, i] /= A[i, i]
+            A[i + 1:, i + 1:] -= np.outer(A[i + 1:, i], A[i, i + 1:])
+
+        self.lu = A
+        self.perm = perm
+
+    def solve(self, b):
+        """Решение для вектора b или блока правых частей формы (n, k)"""
+        b = np.asarray(b, dtype=float)
+        n = len(self.lu)
+        if b.shape[0] != n:
+            raise ValueError("Размер правой части не совпадает с размером матрицы")
+
+        y = b[self.perm]
+        for i in range(1, n):
+            y[i] -= self.lu[i, :i] @ y[:i]
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - self.lu[i, i + 1:] @ y[i + 1:]) / self.lu[i, i]
+        return y
+
+
 def gauss_elimination(A, b):
-    n = len(A)
-    A = A.copy().astype(float)
-    b = b.copy().astype(float)
+    return LUDecomposition(A).solve(b)
+
+
+def gauss_elimination_batch(A, b):
+    """Метод Гаусса для стопки систем A формы (batch, n, n) и b формы (batch, n)"""
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    m, n = b.shape
+    if A.shape != (m, n, n):
+        raise ValueError("Ожидаются массивы формы (batch, n, n) и (batch, n)")
+
+    rows = np.arange(m)
+    singular = np.zeros(m, dtype=bool)
+    # Ведущий элемент сравнивается с нормой своей исходной строки, а не со всей матрицей,
+    # чтобы плохо масштабированные по строкам системы не считались вырожденными
+    threshold = np.finfo(float).eps * n * np.max(np.abs(A), axis=2)
 
     for i in range(n):
-        div = A[i][i]
-        A[i] /= div
-        b[i] /= div
-        for j in range(i + 1, n):
-            factor = A[j][i]
-            A[j] -= factor * A[i]
-            b[j] -= factor * b[i]
-
-    x = np.zeros(n)
+        # Выбор ведущего элемента в столбце i для каждой системы
+        p = i + np.argmax(np.abs(A[:, i:, i]), axis=1)
+        A[rows, i], A[rows, p] = A[rows, p], A[rows, i].copy()
+        b[rows, i], b[rows, p] = b[rows, p], b[rows, i].copy()
+        threshold[rows, i], threshold[rows, p] = threshold[rows, p], threshold[rows, i].copy()
+
+        pivot = A[:, i, i]
+        zero = np.abs(pivot) <= threshold[:, i]
+        singular |= zero
+        pivot = np.where(zero, 1.0, pivot)
+
+        factors = A[:, i + 1:, i] / pivot[:, None]
+        A[:, i + 1:, i:] -= factors[:, :, None] * A[:, None, i, i:]
+        b[:, i + 1:] -= factors * b[:, i, None]
+
+    x = np.zeros((m, n))
+    diagonal = np.where(singular[:, None], 1.0, np.diagonal(A, axis1=1, axis2=2))
     for i in range(n - 1, -1, -1):
-        x[i] = b[i]
-        for j in range(i + 1, n):
-            x[i] -= A[i][j] * x[j]
-    return x
+        x[:, i] = (b[:, i] - np.einsum("kj,kj->k", A[:, i, i + 1:], x[:, i + 1:])) / diagonal[:, i]
+    x[singular] = np.nan
+    return x, singular
+
+
+class CSRMatrix:
+    """Разреженная матрица в сжатом строчном формате (CSR)"""
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+        # Номер строки для каждого ненулевого элемента, нужен для умножения на вектор
+        self._rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    @classmethod
+    def from_triplets(cls, rows, cols, values, shape):
+        """Построение по тройкам (строка, столбец, значение), повторные элементы складываются"""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        starts = np.flatnonzero(first)
+
+        data = np.add.reduceat(values, starts) if len(values) else values
+        rows, cols = rows[starts], cols[starts]
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=shape[0]))))
+        return cls(data, cols, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype=float)
+        rows, cols = np.nonzero(A)
+        return cls.from_triplets(rows, cols, A[rows, cols], A.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __matmul__(self, x):
+        return np.bincount(self._rows, weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def row(self, i):
+        """Номера столбцов и значения ненулевых элементов строки i"""
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self.data[start:stop]
+
+    def take_rows(self, rows):
+        """Подматрица из строк с номерами rows"""
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = self.indptr[rows]
+        counts = self.indptr[rows + 1] - starts
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        positions = np.arange(indptr[-1]) + np.repeat(starts - indptr[:-1], counts)
+        return CSRMatrix(self.data[positions], self.indices[positions], indptr, (len(rows), self.shape[1]))
+
+    def diagonal(self):
+        diagonal = np.zeros(min(self.shape))
+        mask = self._rows == self.indices
+        diagonal[self._rows[mask]] = self.data[mask]
+        return diagonal
+
+
+def _residual(A, x, b, out):
+    """Невязка A @ x - b в заранее выделенный массив out"""
+    if isinstance(A, np.ndarray):
+        np.matmul(A, x, out=out)
+    else:
+        out[:] = A @ x
+    out -= b
+    return out
 
 
 def simple_iteration(A, b, x0, E):
-    n = len(A)
     k = 0
-    x = x0.copy()
-    max_error = np.max(np.abs((A @ x - b) / A.diagonal()))
+    diagonal = A.diagonal()
+    x = np.array(x0, dtype=float)
+    x_new = np.empty_like(x)
+    r = np.empty_like(x)
+    step = np.empty_like(x)
+
+    # Одно умножение на матрицу за итерацию: та же невязка дает и критерий остановки, и шаг
+    np.divide(_residual(A, x, b, r), diagonal, out=step)
+    max_error = np.max(np.abs(step))
 
     while max_error >= E:
-        x_new = np.zeros(n)
-        for i in range(n):
-            x_new[i] = (b[i] - np.dot(A[i, :i], x[:i]) -
-                        np.dot(A[i, i + 1:], x[i + 1:])) / A[i, i]
-        x = x_new.copy()
+        np.subtract(x, step, out=x_new)
+        x, x_new = x_new, x
         k += 1
-        max_error = np.max(np.abs((A @ x - b) / A.diagonal()))
+        np.divide(_residual(A, x, b, r), diagonal, out=step)
+        max_error = np.max(np.abs(step))
 
     return x, k, max_error
 
 
-def seidel_method(A, b, x0, E):
+def multicolor_ordering(A):
+    """Раскраска неизвестных по графу разреженности A, неизвестные одного цвета между собой не связаны"""
+    n = len(A)
+    if isinstance(A, CSRMatrix):
+        rows, cols = A._rows, A.indices
+    else:
+        rows, cols = np.nonzero(A)
+
+    # Симметризованный граф без петель: i и j соседи, если A[i, j] != 0 или A[j, i] != 0
+    off = rows != cols
+    u = np.concatenate((rows[off], cols[off]))
+    v = np.concatenate((cols[off], rows[off]))
+    order = np.argsort(u, kind="stable")
+    u, v = u[order], v[order]
+    starts = np.searchsorted(u, np.arange(n + 1))
+
+    # Жадная раскраска: каждому узлу - наименьший цвет, не занятый соседями
+    color = np.full(n, -1)
+    for i in range(n):
+        taken = set(color[v[starts[i]:starts[i + 1]]].tolist())
+        c = 0
+        while c in taken:
+            c += 1
+        color[i] = c
+
+    return [np.flatnonzero(color == c) for c in range(color.max() + 1)]
+
+
+def _color_blocks(A):
+    """Для каждого цвета: номера неизвестных, их строки матрицы и диагональные элементы"""
+    diagonal = A.diagonal()
+    blocks = []
+    for index in multicolor_ordering(A):
+        rows = A.take_rows(index) if isinstance(A, CSRMatrix) else A[index]
+        blocks.append((index, rows, diagonal[index]))
+    return blocks
+
+
+def _check_ordering(ordering):
+    if ordering not in ("lexicographic", "multicolor"):
+        raise ValueError(f"Неизвестный порядок обхода: {ordering}")
+
+
+def seidel_method(A, b, x0, E, ordering="lexicographic"):
     n = len(A)
     k = 0
-    x = x0.copy()
-    max_error = np.max(np.abs((A @ x - b) / A.diagonal()))
+    x = np.array(x0, dtype=float)
+    diagonal = A.diagonal()
+    max_error = np.max(np.abs((A @ x - b) / diagonal))
+    _check_ordering(ordering)
+    if ordering == "multicolor":
+        blocks = _color_blocks(A)
 
     while max_error >= E:
-        x_new = np.zeros(n)
-        for i in range(n):
-            x_new[i] = (b[i] - np.dot(A[i, :i], x_new[:i]) -
-                        np.dot(A[i, i + 1:], x[i + 1:])) / A[i, i]
+        if ordering == "multicolor":
+            # Все неизвестные одного цвета обновляются сразу
+            x_new = x.copy()
+            for index, rows, d in blocks:
+                x_new[index] = (b[index] - (rows @ x_new - d * x_new[index])) / d
+        elif isinstance(A, CSRMatrix):
+            # Обновление на месте: x[j] при j < i уже новые, при j > i - старые
+            x_new = x.copy()
+            for i in range(n):
+                cols, values = A.row(i)
+                x_new[i] = (b[i] - values @ x_new[cols] + diagonal[i] * x_new[i]) / diagonal[i]
+        else:
+            x_new = np.zeros(n)
+            for i in range(n):
+                x_new[i] = (b[i] - np.dot(A[i, :i], x_new[:i]) -
+                            np.dot(A[i, i + 1:], x[i + 1:])) / A[i, i]
         x = x_new.copy()
         k += 1
-        max_error = np.max(np.abs((A @ x - b) / A.diagonal()))
+        max_error = np.max(np.abs((A @ x - b) / diagonal))
 
     return x, k, max_error
 
 
-def relaxation(A, b, E, omega):
+def relaxation(A, b, E, omega, ordering="lexicographic", x0=None):
     n = len(A)
-    x = np.zeros(n)
-    x_prev = np.zeros(n)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    x_prev = x.copy()
     k = 0
     r = np.inf
+    diagonal = A.diagonal()
+    _check_ordering(ordering)
+    if ordering == "multicolor":
+        blocks = _color_blocks(A)
 
     while r > E:
-        for i in range(n):
-            x[i] = (1 - omega) * x_prev[i] + (omega / A[i, i]) * \
-                   (b[i] - np.sum(A[i, :i] * x[:i]) -
-                    np.sum(A[i, i + 1:] * x_prev[i + 1:]))
+        if ordering == "multicolor":
+            for index, rows, d in blocks:
+                x[index] = (1 - omega) * x_prev[index] + (omega / d) * \
+                           (b[index] - (rows @ x - d * x[index]))
+        elif isinstance(A, CSRMatrix):
+            for i in range(n):
+                cols, values = A.row(i)
+                x[i] = (1 - omega) * x_prev[i] + (omega / diagonal[i]) * \
+                       (b[i] - values @ x[cols] + diagonal[i] * x[i])
+        else:
+            for i in range(n):
+                x[i] = (1 - omega) * x_prev[i] + (omega / A[i, i]) * \
+                       (b[i] - np.sum(A[i, :i] * x[:i]) -
+                        np.sum(A[i, i + 1:] * x_prev[i + 1:]))
         r = np.max(np.abs((x - x_prev) / x))
         x_prev = x.copy()
         k += 1
@@ -108,6 +368,150 @@ def relaxation(A, b, E, omega):
     return x, k, r
 
 
+def estimate_jacobi_radius(A, b, tolerance=0.003, max_iter=None):
+    """Оценка спектрального радиуса матрицы метода Якоби (A симметричная): (ρ, последнее приближение, число итераций)"""
+    if max_iter is None:
+        max_iter = max(20, 2 * len(b))
+    diagonal = A.diagonal()
+    x = np.zeros(len(b))
+    r = np.empty_like(x)
+    step = _residual(A, x, b, r) / diagonal
+    norm = np.dot(step * diagonal, step)
+    ratios = []
+    rho = None
+    k = 0
+    while k < max_iter and norm > 0:
+        x -= step
+        k += 1
+        # Шаги Якоби связаны как d_(k+1) = J d_k, отношение их D-норм возрастает к ρ
+        step = _residual(A, x, b, r) / diagonal
+        next_norm = np.dot(step * diagonal, step)
+        ratios.append(np.sqrt(next_norm / norm))
+        norm = next_norm
+        if len(ratios) < 3:
+            continue
+
+        # Экстраполяция Эйткена ускоряет сходимость оценки,
+        # для ω важна величина 1 - ρ, поэтому точность оценки берется относительно нее
+        r0, r1, r2 = ratios[-3:]
+        estimate = r2
+        denominator = r2 - 2 * r1 + r0
+        if denominator != 0:
+            extrapolated = r2 - (r2 - r1) ** 2 / denominator
+            if r2 <= extrapolated < 1:
+                estimate = extrapolated
+        settled = rho is not None and abs(estimate - rho) < tolerance * (1 - estimate)
+        rho = estimate
+        if settled:
+            break
+
+    if rho is None:
+        rho = ratios[-1] if ratios else 0.0
+    return min(rho, 1 - 1e-6), x, k
+
+
+def optimize_relaxation(A, b, E, omegas=None, workers=None):
+    """Подбор ω для метода релаксации: перебор кандидатов в пуле процессов или адаптивная оценка"""
+    if omegas is None:
+        # Итерации оценки не пропадают: релаксация начинается с последнего приближения Якоби
+        rho, x0, k_jacobi = estimate_jacobi_radius(A, b)
+        omega = 2 / (1 + np.sqrt(1 - rho ** 2))
+        x, k, r = relaxation(A, b, E, omega, x0=x0)
+        k += k_jacobi
+        return omega, x, k, r, [(omega, x, k, r)]
+
+    omegas = list(omegas)
+    n = len(omegas)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        solutions = list(executor.map(relaxation, [A] * n, [b] * n, [E] * n, omegas))
+
+    results = [(omega, x, k, r) for omega, (x, k, r) in zip(omegas, solutions)]
+    best = min(results, key=lambda result: result[2])
+    return best + (results,)
+
+
+def _ssor_apply(A, diagonal, r, omega):
+    """z = M^(-1) r для SSOR: M = ω/(2-ω) (D/ω + L) (D/ω)^(-1) (D/ω + U)"""
+    n = len(r)
+    d = diagonal / omega
+    y = np.zeros(n)
+    for i in range(n):
+        if isinstance(A, CSRMatrix):
+            cols, values = A.row(i)
+            lower = cols < i
+            s = values[lower] @ y[cols[lower]]
+        else:
+            s = A[i, :i] @ y[:i]
+        y[i] = (r[i] - s) / d[i]
+
+    y *= d
+    z = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        if isinstance(A, CSRMatrix):
+            cols, values = A.row(i)
+            upper = cols > i
+            s = values[upper] @ z[cols[upper]]
+        else:
+            s = A[i, i + 1:] @ z[i + 1:]
+        z[i] = (y[i] - s) / d[i]
+    return z * (2 - omega) / omega
+
+
+def conjugate_gradient(A, b, x0, E, preconditioner=None, omega=1.0, diagonal=None, max_iter=None):
+    if preconditioner not in (None, "jacobi", "ssor"):
+        raise ValueError(f"Неизвестный предобуславливатель: {preconditioner}")
+
+    # A - плотная матрица, CSRMatrix или функция умножения на вектор
+    if callable(A):
+        if preconditioner == "ssor":
+            raise ValueError("Для SSOR нужны элементы матрицы, а не только умножение на вектор")
+        matvec = A
+    else:
+        matvec = A.__matmul__
+        if diagonal is None:
+            diagonal = A.diagonal()
+    if preconditioner == "jacobi" and diagonal is None:
+        raise ValueError("Для предобуславливателя Якоби нужна диагональ матрицы")
+    if max_iter is None:
+        max_iter = 10 * len(b)
+
+    def precondition(r):
+        if preconditioner == "jacobi":
+            return r / diagonal
+        if preconditioner == "ssor":
+            return _ssor_apply(A, diagonal, r, omega)
+        return r.copy()
+
+    def error(r):
+        # Тот же критерий, что в методах Якоби и Зейделя, если диагональ известна
+        return np.max(np.abs(r / diagonal)) if diagonal is not None else np.max(np.abs(r))
+
+    k = 0
+    x = np.array(x0, dtype=float)
+    r = b - matvec(x)
+    max_error = error(r)
+    z = precondition(r)
+    p = z.copy()
+    rz = r @ z
+
+    while max_error >= E and k < max_iter:
+        Ap = matvec(p)
+        alpha = rz / (p @ Ap)
+        x += alpha * p
+        r -= alpha * Ap
+        k += 1
+        max_error = error(r)
+        if max_error < E:
+            break
+
+        z = precondition(r)
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    return x, k, max_error
+
+
 if __name__ == "__main__":
     A = np.array([[7, 0.8, 0.9], [0.8, 8, 1], [0.9, 1, 9]])
     b = np.array([63.5, 78.6, 95.3])
@@ -116,6 +520,20 @@ if __name__ == "__main__":
     x_gauss = gauss_elimination(A, b)
     print("Метод Гаусса:", x_gauss)
 
+    # LU-разложение: одна факторизация для нескольких правых частей
+    lu = LUDecomposition(A)
+    B = np.column_stack((b, 2 * b, A @ np.ones(3)))
+    print("LU-разложение, три правые части:")
+    print(lu.solve(B))
+
+    # Пакетный метод Гаусса: исходная система, ее перестановка строк и вырожденная система
+    A_batch = np.stack((A, A[[2, 0, 1]], np.ones((3, 3))))
+    b_batch = np.stack((b, b[[2, 0, 1]], b))
+    x_batch, singular = gauss_elimination_batch(A_batch, b_batch)
+    print("Пакетный метод Гаусса:")
+    print(x_batch)
+    print("Вырожденные системы:", singular)
+
     # Метод простой итерации
     x0 = np.zeros(3)
     E = 0.0001
@@ -130,8 +548,31 @@ if __name__ == "__main__":
     print("Количество итераций:", k_seidel)
     print("Погрешность:", error_seidel)
 
+    # Те же методы с разреженной матрицей
+    A_csr = CSRMatrix.from_dense(A)
+    x_csr, k_csr, error_csr = seidel_method(A_csr, b, x0, E)
+    print("Метод Зейделя (CSR):", x_csr)
+    print("Количество итераций:", k_csr)
+    print("Погрешность:", error_csr)
+
+    x_color, k_color, error_color = seidel_method(A_csr, b, x0, E, ordering="multicolor")
+    print("Метод Зейделя (CSR, многоцветное упорядочивание):", x_color)
+    print("Количество итераций:", k_color)
+    print("Погрешность:", error_color)
+
+    # Метод сопряженных градиентов
+    for name, preconditioner in [("без предобуславливателя", None), ("Якоби", "jacobi"), ("SSOR", "ssor")]:
+        x_cg, k_cg, error_cg = conjugate_gradient(A, b, x0, E, preconditioner=preconditioner)
+        print(f"Метод сопряженных градиентов ({name}):", x_cg)
+        print("Количество итераций:", k_cg)
+        print("Погрешность:", error_cg)
+
     # Метод релаксации
     print("\nМетод верхней релаксации:")
-    for omega in np.arange(0.1, 1.2, 0.1):
-        x_relax, k_relax, r_relax = relaxation(A, b, E, omega)
-        print(f"Омега = {omega:.1f}: {x_relax}, Итераций: {k_relax}, Погрешность: {r_relax:.6f}")
\ No newline at end of file
+    omega_best, x_best, k_best, r_best, results = optimize_relaxation(A, b, E, np.arange(0.1, 1.2, 0.1))
+    for omega, x_relax, k_relax, r_relax in results:
+        print(f"Омега = {omega:.1f}: {x_relax}, Итераций: {k_relax}, Погрешность: {r_relax:.6f}")
+    print(f"Лучшее Омега = {omega_best:.1f}: {x_best}, Итераций: {k_best}")
+
+    omega_opt, x_opt, k_opt, r_opt, _ = optimize_relaxation(A, b, E)
+    print(f"Адаптивное Омега = {omega_opt:.3f}: {x_opt}, Итераций: {k_opt}, Погрешность: {r_opt:.6f}")
\ No newline at end of file
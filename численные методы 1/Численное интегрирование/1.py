@@ -12,37 +12,161 @@
 Вычисляются три типа разностных производных в точках x = 1.1, 1.2, 1.3, 1.4
 
 Для каждого метода вычисляется погрешность относительно аналитической производной
+
+Метод Ромберга:
+
+Формула трапеций уточняется удвоением числа шагов, накопленная сумма сохраняется,
+на каждом уровне функция вычисляется только в новых серединах отрезков
+
+Над последовательностью трапеций строится таблица Ричардсона: R[k][m] = R[k][m-1] + (R[k][m-1] - R[k-1][m-1]) / (4^m - 1)
+
+Счет останавливается, когда диагональные элементы таблицы отличаются меньше чем на e
+
+Векторные вычисления:
+
+Узлы формулы собираются в массив NumPy, подынтегральная функция вызывается один раз для всего массива,
+интеграл получается взвешенной суммой значений
+
+Если функция не принимает массивы (например, math.sin), она вычисляется поэлементно
+
+Адаптивный метод Симпсона:
+
+Для каждого отрезка сравниваются формула Симпсона на всем отрезке и на двух его половинах,
+локальная погрешность оценивается как |S2 - S1| / 15
+
+Отрезки хранятся в очереди с приоритетом (heapq) по убыванию оценки погрешности
+
+Пока суммарная оценка больше e, делится пополам отрезок с наибольшей погрешностью,
+поэтому мелкий шаг появляется только там, где функция меняется резко
+
+Квадратура Гаусса–Лежандра:
+
+Формула порядка m точна для многочленов степени до 2m - 1, узлы и веса - корни многочлена Лежандра и их веса
+
+Узлы и веса для каждого порядка вычисляются один раз и хранятся в общем для процесса словаре,
+при заданном каталоге они сохраняются на диск (np.savez) и загружаются оттуда в других запусках
+
+Составная формула применяет правило порядка m на каждом из n равных отрезков
 """
 
+import heapq
+import os
+
+import numpy as np
+
 
 def f(x):
     return x + (x ** 2) / 4 + (x ** 3) / 96
 
 
+def evaluate(func, x):
+    """Значения func в узлах x: один векторный вызов, для скалярных функций - поэлементно"""
+    try:
+        values = np.asarray(func(x), dtype=float)
+        if values.shape == x.shape:
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter((func(xi) for xi in x), dtype=float, count=len(x))
+
+
 def right_rectangles(a, b, n, func):
     h = (b - a) / n
-    s = 0
-    for i in range(1, n + 1):
-        s += func(a + i * h)
-    return s * h
+    values = evaluate(func, a + h * np.arange(1, n + 1))
+    return float(np.sum(values)) * h
 
 
 def trapezoidal(a, b, n, func):
     h = (b - a) / n
-    s = (func(a) + func(b)) / 2
-    for i in range(1, n):
-        s += func(a + i * h)
-    return s * h
+    values = evaluate(func, a + h * np.arange(n + 1))
+    return float(np.sum(values) - (values[0] + values[-1]) / 2) * h
 
 
 def simpson(a, b, n, func):
     h = (b - a) / n
-    s = func(a) + func(b)
-    for i in range(1, n, 2):
-        s += 4 * func(a + i * h)
-    for i in range(2, n - 1, 2):
-        s += 2 * func(a + i * h)
-    return s * h / 3
+    values = evaluate(func, a + h * np.arange(n + 1))
+    weights = np.full(n + 1, 2.0)
+    weights[1::2] = 4
+    weights[0] = weights[-1] = 1
+    return float(np.dot(weights, values)) * h / 3
+
+
+def _simpson_interval(left, right, values):
+    """Оценка на отрезке по пяти значениям: (уточненное значение, оценка погрешности)"""
+    f0, f1, f2, f3, f4 = values
+    h = (right - left) / 6
+    whole = h * (f0 + 4 * f2 + f4)
+    halves = h / 2 * (f0 + 4 * f1 + 2 * f2 + 4 * f3 + f4)
+    return halves + (halves - whole) / 15, abs(halves - whole) / 15
+
+
+def adaptive_quadrature(a, b, func, e=0.0001, n=1, max_intervals=100000):
+    """Адаптивный метод Симпсона: (значение, число вычислений функции, оценка погрешности)"""
+    edges = a + (b - a) / n * np.arange(n + 1)
+    points = (edges[:-1, None] + (edges[1:] - edges[:-1])[:, None] * np.linspace(0, 1, 5)).ravel()
+    values = evaluate(func, points).reshape(n, 5)
+    evaluations = 5 * n
+
+    heap = []
+    total_error = 0.0
+    for left, right, interval_values in zip(edges[:-1].tolist(), edges[1:].tolist(), values.tolist()):
+        value, error = _simpson_interval(left, right, interval_values)
+        heapq.heappush(heap, (-error, left, right, value, tuple(interval_values)))
+        total_error += error
+
+    while total_error > e and len(heap) < max_intervals:
+        error, left, right, _, (f0, f1, f2, f3, f4) = heapq.heappop(heap)
+        total_error += error
+        middle = (left + right) / 2
+        # Значения в концах и серединах половин уже известны, новые только четвертинки
+        quarter = (right - left) / 8
+        new = evaluate(func, np.array([left + quarter, middle - quarter, middle + quarter, right - quarter])).tolist()
+        evaluations += 4
+        for half_left, half_right, half_values in ((left, middle, (f0, new[0], f1, new[1], f2)),
+                                                   (middle, right, (f2, new[2], f3, new[3], f4))):
+            value, half_error = _simpson_interval(half_left, half_right, half_values)
+            heapq.heappush(heap, (-half_error, half_left, half_right, value, half_values))
+            total_error += half_error
+
+    return float(sum(item[3] for item in heap)), evaluations, float(total_error)
+
+
+def adaptive_simpson(a, b, n, func, e=0.0001):
+    """Адаптивный метод Симпсона с n начальными отрезками, для таблицы методов"""
+    return adaptive_quadrature(a, b, func, e, n)[0]
+
+
+_gauss_cache = {}
+
+
+def gauss_nodes(order, directory=None):
+    """Узлы и веса Гаусса–Лежандра на [-1, 1] для заданного порядка, с кэшем в памяти и на диске"""
+    if order < 1:
+        raise ValueError("Порядок формулы Гаусса должен быть положительным")
+    if order in _gauss_cache:
+        return _gauss_cache[order]
+
+    path = os.path.join(directory, f"gauss_legendre_{order}.npz") if directory is not None else None
+    if path is not None and os.path.exists(path):
+        with np.load(path) as table:
+            nodes, weights = table["nodes"], table["weights"]
+    else:
+        nodes, weights = np.polynomial.legendre.leggauss(order)
+        if path is not None:
+            np.savez(path, nodes=nodes, weights=weights)
+
+    _gauss_cache[order] = nodes, weights
+    return nodes, weights
+
+
+def gauss_legendre(a, b, n, func, order=5, directory=None):
+    """Составная формула Гаусса–Лежандра порядка order на n отрезках"""
+    nodes, weights = gauss_nodes(order, directory)
+    edges = a + (b - a) / n * np.arange(n + 1)
+    middles = (edges[:-1] + edges[1:]) / 2
+    half = (b - a) / (2 * n)
+    values = evaluate(func, (middles[:, None] + half * nodes).ravel()).reshape(n, order)
+    return float(np.sum(values @ weights)) * half
 
 
 def integrate(a, b, n, func, method, e=0.0001):
@@ -56,8 +180,51 @@ def integrate(a, b, n, func, method, e=0.0001):
     return curr_result, n
 
 
+def trapezoid_refinements(a, b, n, func):
+    """Последовательность формул трапеций с числом шагов n, 2n, 4n, ...: (n, значение, число вычислений функции)"""
+    h = (b - a) / n
+    values = evaluate(func, a + h * np.arange(n + 1))
+    s = float(np.sum(values) - (values[0] + values[-1]) / 2)
+    evaluations = n + 1
+    yield n, s * h, evaluations
+
+    while True:
+        # Старые узлы уже учтены в s, добавляю только новые середины
+        s += float(np.sum(evaluate(func, a + h * (np.arange(n) + 0.5))))
+        evaluations += n
+        n *= 2
+        h /= 2
+        yield n, s * h, evaluations
+
+
+def romberg(a, b, n, func, e=0.0001, max_levels=20):
+    """Интеграл методом Ромберга: (значение, число шагов, число вычислений функции)"""
+    previous = []
+    for level, (steps, trapezoid, evaluations) in enumerate(trapezoid_refinements(a, b, n, func)):
+        row = [trapezoid]
+        for m in range(1, level + 1):
+            row.append(row[m - 1] + (row[m - 1] - previous[m - 1]) / (4 ** m - 1))
+        if (level > 0 and abs(row[-1] - previous[-1]) < e) or level == max_levels:
+            return row[-1], steps, evaluations
+        previous = row
+
+
+class CountedFunction:
+    """Обертка функции со счетчиком вычислений (для массива считается каждый элемент)"""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x):
+        # Считаю после успешного вызова: отклоненный массив вычисляется в evaluate повторно поэлементно
+        values = self.func(x)
+        self.calls += np.size(values)
+        return values
+
+
 def true_integral(a, b):
-    return (b ** 2) / 2 + (b ** 3) / 12 + (b ** 4) / 96 - ((a ** 2) / 2 + (a ** 3) / 12 + (a ** 4) / 96)
+    return (b ** 2) / 2 + (b ** 3) / 12 + (b ** 4) / 384 - ((a ** 2) / 2 + (a ** 3) / 12 + (a ** 4) / 384)
 
 
 a = 0.2
@@ -67,12 +234,57 @@ methods = {
     "прямоугольников": right_rectangles,
     "трапеции": trapezoidal,
     "Симпсона": simpson,
+    "Симпсона (адаптивный)": adaptive_simpson,
+    "Гаусса–Лежандра": gauss_legendre,
 }
 F = true_integral(a, b)
 for name, method in methods.items():
-    result, k = integrate(a, b, n, f, method)
+    counted = CountedFunction(f)
+    result, k = integrate(a, b, n, counted, method)
     R = abs(result - F) / abs(F)
     print(f"Метод {name}:")
-    print(f"    Приближенное значение интеграла: {result}.6f")
+    print(f"    Приближенное значение интеграла: {result:.6f}")
     print(f"    Количество шагов: {k}")
+    print(f"    Вычислений функции: {counted.calls}")
     print(f"    Погрешность: {R}")
+
+result, k, evaluations = romberg(a, b, n, f)
+R = abs(result - F) / abs(F)
+print("Метод Ромберга:")
+print(f"    Приближенное значение интеграла: {result:.6f}")
+print(f"    Количество шагов: {k}")
+print(f"    Вычислений функции: {evaluations}")
+print(f"    Погрешность: {R}")
+
+
+result, evaluations, error = adaptive_quadrature(a, b, f)
+R = abs(result - F) / abs(F)
+print("Адаптивный метод Симпсона:")
+print(f"    Приближенное значение интеграла: {result:.6f}")
+print(f"    Вычислений функции: {evaluations}")
+print(f"    Оценка погрешности: {error}")
+print(f"    Погрешность: {R}")
+
+counted = CountedFunction(f)
+result = gauss_legendre(a, b, 1, counted, order=2)
+R = abs(result - F) / abs(F)
+print("Метод Гаусса–Лежандра (один отрезок, 2 узла):")
+print(f"    Приближенное значение интеграла: {result:.6f}")
+print(f"    Вычислений функции: {counted.calls}")
+print(f"    Погрешность: {R}")
+
+
+def peak(x):
+    return 1 / (1e-4 + (x - 0.3) ** 2)
+
+
+peak_integral = 100 * (np.arctan(70) + np.arctan(30))
+print("Функция с острым пиком 1 / (1e-4 + (x - 0.3)^2) на [0, 1]:")
+counted = CountedFunction(peak)
+result, k = integrate(0, 1, n, counted, simpson)
+print(f"    Симпсон: вычислений функции {counted.calls}, погрешность {abs(result - peak_integral)}")
+result, evaluations, error = adaptive_quadrature(0, 1, peak)
+print(f"    Адаптивный: вычислений функции {evaluations}, погрешность {abs(result - peak_integral)}")
+counted = CountedFunction(peak)
+result, k = integrate(0, 1, n, counted, gauss_legendre)
+print(f"    Гаусс–Лежандр: вычислений функции {counted.calls}, погрешность {abs(result - peak_integral)}")
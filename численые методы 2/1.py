@@ -31,24 +31,53 @@ def rk4_step(x, y, h):
     return y + (h / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
 
 
-def solve_ode(method_name, method_func, h, x_end=2.0):
-    print(f"{method_name}")
-    print(f"h = {h}")
-    print("x\t\tY_прибл\t\tU_точн\t\tПогрешность")
-    print("-" * 50)
+class PrintTracer:
+    """Вывод таблицы решения на консоль"""
 
+    def start(self, method_name, h, steps):
+        print(f"{method_name}")
+        print(f"h = {h}")
+        print("x\t\tY_прибл\t\tU_точн\t\tПогрешность")
+        print("-" * 50)
+
+    def __call__(self, x, y, U_exact, error):
+        print(f"{x:.2f}\t\t{y:.6f}\t\t{U_exact:.6f}\t\t{error:.6f}")
+
+    def finish(self, max_error):
+        print(f"Максимальная погрешность: {max_error:.6f}\n")
+
+
+class HistoryTracer:
+    """Запись строк (x, Y_прибл, U_точн, погрешность) в заранее выделенный список"""
+
+    def start(self, method_name, h, steps):
+        self.rows = [None] * (steps + 1)
+        self.count = 0
+
+    def __call__(self, x, y, U_exact, error):
+        self.rows[self.count] = (x, y, U_exact, error)
+        self.count += 1
+
+    def finish(self, max_error):
+        self.max_error = max_error
+
+
+def solve_ode(method_name, method_func, h, x_end=2.0, tracer=None):
     x = 1.0
     y = 1.0
     max_error = 0.0
 
-    # Выводим начальную точку
+    # Количество шагов
+    N = int((x_end - 1.0) / h)
+    if tracer is not None:
+        tracer.start(method_name, h, N)
+
+    # Начальная точка
     U_exact = exact_solution(x)
     error = abs(y - U_exact)
     max_error = error
-    print(f"{x:.2f}\t\t{y:.6f}\t\t{U_exact:.6f}\t\t{error:.6f}")
-
-    # Количество шагов
-    N = int((x_end - 1.0) / h)
+    if tracer is not None:
+        tracer(x, y, U_exact, error)
 
     for i in range(N):
         y = method_func(x, y, h)
@@ -58,9 +87,11 @@ def solve_ode(method_name, method_func, h, x_end=2.0):
         error = abs(y - U_exact)
         max_error = max(max_error, error)
 
-        print(f"{x:.2f}\t\t{y:.6f}\t\t{U_exact:.6f}\t\t{error:.6f}")
+        if tracer is not None:
+            tracer(x, y, U_exact, error)
 
-    print(f"Максимальная погрешность: {max_error:.6f}\n")
+    if tracer is not None:
+        tracer.finish(max_error)
     return max_error
 
 
@@ -101,7 +132,7 @@ def main():
 
         h_results = {}
         for method_name, method_func in METHODS.items():
-            error = solve_ode(method_name, method_func, h)
+            error = solve_ode(method_name, method_func, h, tracer=PrintTracer())
             h_results[method_name] = error
 
         results[h] = h_results
@@ -22,71 +22,149 @@
 Задание граничных условий из точного решения
 
 Итерационное уточнение решения во внутренних узлах
-"""
-
-
-def solve_poisson_equation():
-    """Решение уравнения Пуассона методом верхней релаксации"""
-
-    N = int(input("N: "))
-    epsilon = float(input("epsilon: "))
 
-    def u_exact(x1, x2):
-        """Точное решение уравнения Пуассона"""
-        return 3 * x1 ** 3 + x2 ** 3 + 3 * x1 + x2 + 3
+Подбор ω:
 
-    def f(x1, x2):
-        """Правая часть уравнения Пуассона: -Δu = -f(x)"""
-        return -18 * x1 - 6 * x2
+Расчеты для разных ω независимы и выполняются параллельно в пуле процессов, решения сохраняются и используются повторно
 
-    def solve(omega):
-        """Решение уравнения Пуассона методом верхней релаксации"""
-        h = 1.0 / N  # Шаг сетки
-        u = [[0.0] * (N + 1) for _ in range(N + 1)]
+Адаптивный режим делает итерации Зейделя (ω = 1), пока отношение евклидовых норм соседних поправок
+(уточненное экстраполяцией Эйткена) не установится, принимает его за спектральный радиус ρ и берет ω = 2 / (1 + √(1 - ρ))
 
-        for i in range(N + 1):
-            for j in range(N + 1):
-                if i == 0 or i == N or j == 0 or j == N:
-                    u[i][j] = u_exact(i * h, j * h)
-
-        k = 0
-        while True:
-            max_diff = 0.0
+Итерации Зейделя не пропадают: верхняя релаксация продолжается с полученной сетки
+"""
 
-            for i in range(1, N):
-                for j in range(1, N):
-                    old = u[i][j]
-                    new = (u[i - 1][j] + u[i + 1][j] + u[i][j - 1] + u[i][j + 1] + h * h * f(i * h, j * h)) / 4
-                    u[i][j] = omega * new + (1 - omega) * old
-                    max_diff = max(max_diff, abs(u[i][j] - old))
+from concurrent.futures import ProcessPoolExecutor
+from math import pi, sin, sqrt
+
+
+def u_exact(x1, x2):
+    """Точное решение уравнения Пуассона"""
+    return 3 * x1 ** 3 + x2 ** 3 + 3 * x1 + x2 + 3
+
+
+def f(x1, x2):
+    """Правая часть уравнения Пуассона: -Δu = -f(x)"""
+    return -18 * x1 - 6 * x2
+
+
+def initial_grid(N):
+    """Сетка (N+1)×(N+1) с граничными значениями из точного решения и нулями внутри"""
+    h = 1.0 / N
+    u = [[0.0] * (N + 1) for _ in range(N + 1)]
+    for i in range(N + 1):
+        for j in range(N + 1):
+            if i == 0 or i == N or j == 0 or j == N:
+                u[i][j] = u_exact(i * h, j * h)
+    return u
+
+
+def sweep(u, N, omega):
+    """Одна итерация верхней релаксации по внутренним узлам: (максимальная поправка, сумма квадратов поправок)"""
+    h = 1.0 / N
+    max_diff = 0.0
+    squares = 0.0
+    for i in range(1, N):
+        for j in range(1, N):
+            old = u[i][j]
+            new = (u[i - 1][j] + u[i + 1][j] + u[i][j - 1] + u[i][j + 1] + h * h * f(i * h, j * h)) / 4
+            u[i][j] = omega * new + (1 - omega) * old
+            diff = u[i][j] - old
+            max_diff = max(max_diff, abs(diff))
+            squares += diff * diff
+    return max_diff, squares
+
+
+def solve(omega, N, epsilon, max_iter=10000, u=None):
+    """Решение уравнения Пуассона методом верхней релаксации (с начальной сеткой u, если она задана)"""
+    h = 1.0 / N  # Шаг сетки
+    if u is None:
+        u = initial_grid(N)
+
+    k = 0
+    while True:
+        max_diff, _ = sweep(u, N, omega)
+        k += 1
+        if max_diff < epsilon or k > max_iter:
+            break
+
+    max_err = 0.0
+    for i in range(1, N):
+        for j in range(1, N):
+            err = abs(u[i][j] - u_exact(i * h, j * h))
+            max_err = max(max_err, err)
+
+    return k, max_err, u
+
+
+def estimate_omega(N, epsilon, tolerance=0.01, max_iter=None):
+    """Адаптивная оценка ω по итерациям Зейделя: (ω, ρ, сетка после итераций, число итераций)"""
+    if max_iter is None:
+        max_iter = max(20, 4 * N)
+    u = initial_grid(N)
+    ratios = []
+    previous = None
+    rho = None
+    k = 0
+    while k < max_iter:
+        max_diff, squares = sweep(u, N, 1.0)
+        k += 1
+        if max_diff < epsilon or squares == 0:
+            return 1.0, 0.0, u, k
+        if previous is not None:
+            ratios.append(sqrt(squares / previous))
+        previous = squares
+        if len(ratios) < 3:
+            continue
+
+        # Отношение поправок сходится к ρ геометрически, экстраполяция Эйткена ускоряет сходимость оценки
+        r0, r1, r2 = ratios[-3:]
+        estimate = r2
+        denominator = r2 - 2 * r1 + r0
+        if denominator != 0:
+            extrapolated = r2 - (r2 - r1) ** 2 / denominator
+            if r2 <= extrapolated < 1:
+                estimate = extrapolated
+        settled = rho is not None and abs(estimate - rho) < tolerance * (1 - estimate)
+        rho = estimate
+        if settled:
+            break
+
+    rho = min(rho if rho is not None else 0.0, 1 - 1e-6)
+    return 2 / (1 + sqrt(1 - rho)), rho, u, k
+
+
+def optimize_omega(omegas, N, epsilon, workers=None):
+    """Параллельный перебор ω, результат - список (ω, итерации, погрешность, решение)"""
+    n = len(omegas)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        solutions = executor.map(solve, omegas, [N] * n, [epsilon] * n)
+        return [(omega, k, err, u) for omega, (k, err, u) in zip(omegas, solutions)]
 
-            k += 1
-            if max_diff < epsilon or k > 10000:
-                break
 
-        max_err = 0.0
-        for i in range(1, N):
-            for j in range(1, N):
-                err = abs(u[i][j] - u_exact(i * h, j * h))
-                max_err = max(max_err, err)
+def solve_poisson_equation():
+    """Решение уравнения Пуассона методом верхней релаксации"""
 
-        return k, max_err, u
+    N = int(input("N: "))
+    epsilon = float(input("epsilon: "))
 
     print("\nОПТИМАЛЬНЫЙ ПАРАМЕТР РЕЛАКСАЦИИ:")
     print("ω\tИтерации\tПогрешность")
     print("-" * 30)
 
-    results = []
-    for omega in [1.0, 1.2, 1.5, 1.7, 1.9]:
-        k, err, _ = solve(omega)
-        results.append((omega, k, err))
+    results = optimize_omega([1.0, 1.2, 1.5, 1.7, 1.9], N, epsilon)
+    for omega, k, err, _ in results:
         print(f"{omega}\t{k}\t\t{err:.2e}")
 
-    best_omega, best_iter, best_error = min(results, key=lambda x: x[1])
+    best_omega, best_iter, best_error, _ = min(results, key=lambda x: x[1])
     print(f"\nω_opt = {best_omega} (минимум итераций: {best_iter})")
 
+    omega_adaptive, rho, u_seidel, k_seidel = estimate_omega(N, epsilon)
+    k_adaptive, err_adaptive, _ = solve(omega_adaptive, N, epsilon, u=u_seidel)
+    print(f"Адаптивный ω = {omega_adaptive:.4f} (ρ = {rho:.4f}, теоретически ω = {2 / (1 + sin(pi / N)):.4f}): "
+          f"итераций {k_seidel} + {k_adaptive}, погрешность {err_adaptive:.2e}")
+
     print("\nРЕЗУЛЬТАТЫ ДЛЯ ω = 1.7 (метод Зейделя):")
-    iterations, error, u = solve(1.7)
+    _, iterations, error, u = next(result for result in results if result[0] == 1.7)
     print(f"Количество итераций: {iterations}")
     print(f"Максимальная погрешность: {error:.2e}")
 